@@ -1,16 +1,32 @@
 import logging
-import random
+from collections import deque
+from dataclasses import asdict, make_dataclass
+from functools import lru_cache
 from heapq import heappush as hpush
+from itertools import islice
+from random import random
 from typing import Dict, List, Tuple
 
 import yaml
 from util.exceptions import BuildConfigError
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
 hunter_name_spacing: int = 7
 
+# Ozzy's attack types: main attack and triggered attacks, see Ozzy.attack()
+ATK_MAIN, ATK_MS, ATK_ECHO, ATK_ECHO_MS = range(4)
+atk_type_names: Tuple[str, ...] = ('', '(MS)', '(ECHO)', '(ECHO-MS)')
+
+# Event kinds in the simulation queue, see Simulation.simulate_combat(). Numbered in alphabetical order of their names so
+# that events with equal time and priority resolve in the same order as when the names themselves were queued.
+EV_ENEMY, EV_ENEMY_SPECIAL, EV_HUNTER, EV_HUNTER_SPECIAL, EV_REGEN, EV_STUN = range(6)
+event_names: Tuple[str, ...] = ('enemy', 'enemy_special', 'hunter', 'hunter_special', 'regen', 'stun')
+
 # TODO: validate vectid elixir
-# TODO: Ozzy: move @property code to on_death() to speed things up?
-# TODO: Borge: move @property code as well?
 # TODO: DwD power is a little off: 200 ATK, 2 exo, 3 DwD, 1 revive should be 110.59 power but is 110.71. I think DwD might be 0.0196 power instead of 0.02
 
 """ Assumptions:
@@ -23,6 +39,7 @@ class Hunter:
     ### SETUP
     def __init__(self, name: str) -> None:
         self.name = name
+        self._name_pad: str = f'{name:>{hunter_name_spacing}}'
         self.missing_hp: float
         self.missing_hp_pct: float
         self.sim = None
@@ -69,7 +86,7 @@ class Hunter:
             Hunter: The Hunter instance.
         """
         with open(file_path, 'r') as f:
-            cfg = yaml.safe_load(f)
+            cfg = yaml.load(f, Loader=YamlLoader)
         if cfg["meta"]["hunter"].lower() not in ["borge", "ozzy"]:
             raise ValueError("hunter_sim.py: error: invalid hunter found in primary build config file. Please specify a valid hunter.")
         if cls != Hunter:
@@ -86,10 +103,10 @@ class Hunter:
         return {
             "meta": self.meta,
             "stats": self.base_stats,
-            "talents": self.talents,
-            "attributes": self.attributes,
-            "mods": self.mods,
-            "inscryptions": self.inscryptions,
+            "talents": asdict(self.talents),
+            "attributes": asdict(self.attributes),
+            "mods": asdict(self.mods),
+            "inscryptions": asdict(self.inscryptions),
             "relics": self.relics,
             "gems": self.gems,
         }
@@ -130,6 +147,29 @@ class Hunter:
         """
         raise NotImplementedError('load_dummy() not implemented for Hunter() base class')
 
+    def _recompute_stats(self) -> None:
+        """Abstract placeholder for _recompute_stats() method. Must be implemented by child classes.
+
+        Raises:
+            NotImplementedError: When called from the Hunter class.
+        """
+        raise NotImplementedError('_recompute_stats() not implemented for Hunter() base class')
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _config_section(cls, section: str) -> type:
+        """Create a slotted dataclass for one section of the hunter's build config (talents, attributes, mods or
+        inscryptions), with the fields taken from the dummy build. Created once per hunter class and section.
+
+        Args:
+            section (str): The name of the build config section.
+
+        Returns:
+            type: The dataclass type holding the entries of that section.
+        """
+        fields = [(k, type(v)) for k, v in cls.load_dummy()[section].items()]
+        return make_dataclass(f'{cls.__name__}{section.title()}', fields, slots=True)
+
     def load_build(self, config_dict: Dict) -> None:
         """Load a build config from build config dict, validate it and assign the stats to the hunter's internal dictionaries.
 
@@ -143,13 +183,26 @@ class Hunter:
             raise BuildConfigError(invalid_keys)
         self.meta = config_dict["meta"]
         self.base_stats = config_dict["stats"]
-        self.talents = config_dict["talents"]
-        self.attributes = config_dict["attributes"]
-        self.mods = config_dict["mods"]
-        self.inscryptions = {k: self.costs["inscryptions"][k]["max"] if v == "max" else v for k, v in config_dict["inscryptions"].items()}
+        self.talents = self._config_section("talents")(**config_dict["talents"])
+        self.attributes = self._config_section("attributes")(**config_dict["attributes"])
+        self.mods = self._config_section("mods")(**config_dict["mods"])
+        self.inscryptions = self._config_section("inscryptions")(
+            **{k: self.costs["inscryptions"][k]["max"] if v == "max" else v for k, v in config_dict["inscryptions"].items()}
+        )
         self.relics = config_dict["relics"]
         self.gems = config_dict["gems"]
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _dummy_keys(cls) -> Tuple[frozenset, frozenset]:
+        """Collect the section names and entry names of the hunter's dummy build. Created once per hunter class.
+
+        Returns:
+            Tuple[frozenset, frozenset]: The section names and the names of all entries across sections.
+        """
+        dummy = cls.load_dummy()
+        return frozenset(dummy.keys()), frozenset().union(*dummy.values())
+
     def validate_config(self, cfg: Dict) -> bool:
         """Validate a build config dict against a perfect dummy build to see if they have identical keys in themselves and all value entries.
 
@@ -159,7 +212,8 @@ class Hunter:
         Returns:
             bool: Whether the configs contain identical keys.
         """
-        return (set(cfg.keys()) ^ set(self.load_dummy().keys())) | set().union(*cfg.values()) ^ set().union(*self.load_dummy().values())
+        sections, entries = self._dummy_keys()
+        return (set(cfg.keys()) ^ sections) | set().union(*cfg.values()) ^ entries
 
     def validate_build(self) -> Tuple[int, int, set, int, int]:
         """Validate the attributes of a build to make sure no attribute maximum levels are exceeded.
@@ -174,12 +228,12 @@ class Hunter:
             raise ValueError('Cannot validate a Hunter() instance.')
         invalid, attr_spent, tal_spent = set(), 0, 0
         # go through all talents and attributes and check if they are within the valid range, then add their cost to the total
-        for tal in self.talents.keys():
-            if (lvl := self.talents[tal]) > self.costs["talents"][tal]["max"]:
+        for tal, lvl in asdict(self.talents).items():
+            if lvl > self.costs["talents"][tal]["max"]:
                 invalid.add(tal)
             tal_spent += lvl
-        for att in self.attributes.keys():
-            if (lvl := self.attributes[att]) > self.costs["attributes"][att]["max"]:
+        for att, lvl in asdict(self.attributes).items():
+            if lvl > self.costs["attributes"][att]["max"]:
                 invalid.add(att)
             attr_spent += lvl * self.costs["attributes"][att]["cost"]
         return attr_spent, (self.meta["level"] * 3), invalid, tal_spent, (self.meta["level"])
@@ -199,18 +253,20 @@ class Hunter:
         Args:
             damage (float): The amount of damage to receive.
         """
-        if random.random() < self.evade_chance:
+        if random() < self.evade_chance:
             self.total_evades += 1
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tEVADE')
+            if self.sim.debug:
+                logging.debug(f'[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tEVADE')
             return 0
         else:
-            mitigated_damage = damage * (1 - self.damage_reduction)
+            mitigated_damage = damage * self._damage_taken_mult
             self.hp -= mitigated_damage
             self.total_taken += mitigated_damage
             self.total_mitigated += (damage - mitigated_damage)
             self.total_attacks_suffered += 1
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTAKE\t{mitigated_damage:>6.2f}, {self.hp:.2f} HP left")
-            if self.is_dead():
+            if self.sim.debug:
+                logging.debug(f"[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tTAKE\t{mitigated_damage:>6.2f}, {self.hp:.2f} HP left")
+            if self.hp <= 0:
                 self.on_death()
             return mitigated_damage
 
@@ -222,9 +278,10 @@ class Hunter:
             source (str): The source of the healing. Valid: regen, lifesteal, life_of_the_hunt
         """
         effective_heal = min(value, self.missing_hp)
-        overhealing = value - effective_heal
         self.hp += effective_heal
-        logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\t{source.upper().replace("_", " ")}\t{effective_heal:>6.2f} (+{overhealing:>6.2f} OVERHEAL)')
+        if self.sim.debug:
+            overhealing = value - effective_heal
+            logging.debug(f'[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\t{source.upper().replace("_", " ")}\t{effective_heal:>6.2f} (+{overhealing:>6.2f} OVERHEAL)')
         match source.lower():
             case 'regen':
                 self.total_regen += effective_heal
@@ -241,9 +298,9 @@ class Hunter:
         """Actions to take when the hunter kills an enemy. The Hunter() implementation only handles loot.
         """
         loot = self.compute_loot()
-        if (self.current_stage % 100 != 0 and self.current_stage > 0) and random.random() < self.effect_chance and (LL := self.talents["call_me_lucky_loot"]):
+        if (LL := self.talents.call_me_lucky_loot) and (self.current_stage % 100 != 0 and self.current_stage > 0) and random() < self.effect_chance:
             # Talent: Call Me Lucky Loot, cannot proc on bosses
-            loot *= 1 + (self.talents["call_me_lucky_loot"] * 0.2)
+            loot *= 1 + (self.talents.call_me_lucky_loot * 0.2)
             self.total_effect_procs += 1
         loot *= (1 + 0.25 * self.gems["attraction_node_#3"])
         self.total_loot += loot
@@ -257,6 +314,7 @@ class Hunter:
         self.current_stage += stages
         if self.current_stage >= 100:
             self.catching_up = False
+        self._recompute_stats()
 
     def compute_loot(self) -> float:
         """Compute the amount of loot gained from a kill. Affected by stage loot bonus, talents and attributes.
@@ -267,11 +325,11 @@ class Hunter:
         stage_mult = (1.05 ** (self.current_stage+1)) * (5 if self.current_stage >= 101 else 1)
         if isinstance(self, Borge):
             base_loot = 1.0 if self.current_stage != 100 else (700 + 500 + 60 + 50)
-            timeless_mastery = 1 + self.attributes["timeless_mastery"] * 0.14
-            additional_multipliers = 1 + (self.inscryptions["i60"] * 0.03)
+            timeless_mastery = 1 + self.attributes.timeless_mastery * 0.14
+            additional_multipliers = 1 + (self.inscryptions.i60 * 0.03)
         elif isinstance(self, Ozzy):
             base_loot = 1.0 if self.current_stage != 100 else (400 + 300 + 60 + 50)
-            timeless_mastery = 1 + (self.attributes["timeless_mastery"] * 0.16)
+            timeless_mastery = 1 + (self.attributes.timeless_mastery * 0.16)
             additional_multipliers = 1
         return base_loot * 0.01 * stage_mult * timeless_mastery * additional_multipliers
 
@@ -287,13 +345,16 @@ class Hunter:
         """Actions to take when the hunter dies. Logs the revive and resets the hp to 80% of max hp if a `Death is my Companion`
         charge can be used. If no revives are left, the hunter is marked as dead.
         """
-        if self.times_revived < self.talents["death_is_my_companion"]:
+        if self.times_revived < self.talents.death_is_my_companion:
             self.hp = self.max_hp * 0.8
             self.revive_log.append(self.current_stage)
             self.times_revived += 1
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tREVIVED, {self.talents["death_is_my_companion"] - self.times_revived} left')
+            self._recompute_stats()
+            if self.sim.debug:
+                logging.debug(f'[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tREVIVED, {self.talents.death_is_my_companion - self.times_revived} left')
         else:
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tDIED\n')
+            if self.sim.debug:
+                logging.debug(f'[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tDIED\n')
 
 
     ### UTILITY
@@ -337,8 +398,8 @@ class Hunter:
             c_on = c_off
         print(self)
         print('Stats {}:\t{} {} {}   {} {} {}   {} {} {}'.format(f'({c_on}l.{c_off}{self.meta["level"]:>3})', *self.base_stats.values()))
-        print(f'Tal {tals}:\t' + ' '.join('[{}{}{}: {}]'.format(c_on, ''.join([l[0].upper() for l in k.split('_')]), c_off, v) for k, v in self.talents.items()))
-        print(f'Att {attr}:\t' + ' '.join('[{}{}{}: {}]'.format(c_on, ''.join([l[0].upper() for l in k.split('_')]), c_off, v) for k, v in self.attributes.items()))
+        print(f'Tal {tals}:\t' + ' '.join('[{}{}{}: {}]'.format(c_on, ''.join([l[0].upper() for l in k.split('_')]), c_off, v) for k, v in asdict(self.talents).items()))
+        print(f'Att {attr}:\t' + ' '.join('[{}{}{}: {}]'.format(c_on, ''.join([l[0].upper() for l in k.split('_')]), c_off, v) for k, v in asdict(self.attributes).items()))
         print(f'Gems:\t\t' + ' '.join('[{}{}{}: {}]'.format(c_on, ''.join(gem_names[k]), c_off, gem_state[v] if k not in ['attraction_gem', 'attraction_catch-up'] else v) for k, v in self.gems.items()))
         print(f'Relics:\t\t' + ' '.join('[{}{}{}: {}]'.format(c_on, ''.join([l[0].upper() for l in k.split('_')]), c_off, v) for k, v in self.relics.items()))
         if invalid:
@@ -351,7 +412,7 @@ class Hunter:
         Returns:
             str: The stats as a formatted string.
         """
-        return f'[{self.name:>{hunter_name_spacing}}]:\t[HP:{(str(round(self.hp, 2)) + "/" + str(round(self.max_hp, 2))):>18}] [AP:{self.power:>8.2f}] [Regen:{self.regen:>7.2f}] [DR: {self.damage_reduction:>6.2%}] [Evasion: {self.evade_chance:>6.2%}] [Effect: {self.effect_chance:>6.2%}] [SpC: {self.special_chance:>6.2%}] [SpD: {self.special_damage:>5.2f}] [Speed:{self.speed:>5.2f}] [LS: {self.lifesteal:>4.2%}]'
+        return f'[{self._name_pad}]:\t[HP:{(str(round(self.hp, 2)) + "/" + str(round(self.max_hp, 2))):>18}] [AP:{self.power:>8.2f}] [Regen:{self.regen:>7.2f}] [DR: {self.damage_reduction:>6.2%}] [Evasion: {self.evade_chance:>6.2%}] [Effect: {self.effect_chance:>6.2%}] [SpC: {self.special_chance:>6.2%}] [SpD: {self.special_damage:>5.2f}] [Speed:{self.speed:>5.2f}] [LS: {self.lifesteal:>4.2%}]'
 
 
 class Borge(Hunter):
@@ -486,7 +547,7 @@ class Borge(Hunter):
     }
 
     def __init__(self, config_dict: Dict):
-        super(Borge, self).__init__(name='Borge')
+        super().__init__(name='Borge')
         self.__create__(config_dict)
 
         # statistics
@@ -515,11 +576,11 @@ class Borge(Hunter):
             (
                 43
                 + (self.base_stats["hp"] * (2.50 + 0.01 * (self.base_stats["hp"] // 5)))
-                + (self.inscryptions["i3"] * 6)
-                + (self.inscryptions["i27"] * 24)
+                + (self.inscryptions.i3 * 6)
+                + (self.inscryptions.i27 * 24)
             )
-            * (1 + (self.attributes["soul_of_ares"] * 0.01))
-            * (1 + (self.inscryptions["i60"] * 0.03))
+            * (1 + (self.attributes.soul_of_ares * 0.01))
+            * (1 + (self.inscryptions.i60 * 0.03))
             * (1 + (self.relics["disk_of_dawn"] * 0.02))
             * (1 + (0.015 * (self.meta["level"] - 39)) * self.gems["creation_node_#3"])
             * (1 + (0.02 * self.gems["creation_node_#2"]))
@@ -527,15 +588,15 @@ class Borge(Hunter):
         )
         self.hp = self.max_hp
         # power
-        self.power = (
+        self._power = (
             (
                 3
                 + (self.base_stats["power"] * (0.5 + 0.01 * (self.base_stats["power"] // 10)))
-                + (self.inscryptions["i13"] * 1)
-                + (self.talents["impeccable_impacts"] * 2)
+                + (self.inscryptions.i13 * 1)
+                + (self.talents.impeccable_impacts * 2)
             )
-            * (1 + (self.attributes["soul_of_ares"] * 0.002))
-            * (1 + (self.inscryptions["i60"] * 0.03))
+            * (1 + (self.attributes.soul_of_ares * 0.002))
+            * (1 + (self.inscryptions.i60 * 0.03))
             * (1 + (self.relics["long_range_artillery_crawler"] * 0.02))
             * (1 + (0.01 * (self.meta["level"] - 39)) * self.gems["creation_node_#3"])
             * (1 + (0.02 * self.gems["creation_node_#2"]))
@@ -546,19 +607,19 @@ class Borge(Hunter):
             (
                 0.02
                 + (self.base_stats["regen"] * (0.03 + 0.01 * (self.base_stats["regen"] // 30)))
-                + (self.attributes["essence_of_ylith"] * 0.04)
+                + (self.attributes.essence_of_ylith * 0.04)
             )
-            * (1 + (self.attributes["essence_of_ylith"] * 0.009))
+            * (1 + (self.attributes.essence_of_ylith * 0.009))
             * (1 + (0.005 * (self.meta["level"] - 39)) * self.gems["creation_node_#3"])
             * (1 + (0.02 * self.gems["creation_node_#2"]))
         )
         # damage_reduction
-        self.damage_reduction = (
+        self._damage_reduction = (
             (
                 0
                 + (self.base_stats["damage_reduction"] * 0.0144)
-                + (self.attributes["spartan_lineage"] * 0.015)
-                + (self.inscryptions["i24"] * 0.004)
+                + (self.attributes.spartan_lineage * 0.015)
+                + (self.inscryptions.i24 * 0.004)
             )
             * (1 + (0.02 * self.gems["creation_node_#2"]))
         )
@@ -566,26 +627,26 @@ class Borge(Hunter):
         self.evade_chance = (
             0.01
             + (self.base_stats["evade_chance"] * 0.0034)
-            + (self.attributes["superior_sensors"] * 0.016)
+            + (self.attributes.superior_sensors * 0.016)
         )
         # effect_chance
-        self.effect_chance = (
+        self._effect_chance = (
             (
                 0.04
                 + (self.base_stats["effect_chance"] * 0.005)
-                + (self.attributes["superior_sensors"] * 0.012)
-                + (self.inscryptions["i11"] * 0.02)
+                + (self.attributes.superior_sensors * 0.012)
+                + (self.inscryptions.i11 * 0.02)
                 + (0.03 * self.gems["innovation_node_#3"])
             )
             * (1 + (0.02 * self.gems["creation_node_#2"]))
         )
         # special_chance
-        self.special_chance = (
+        self._special_chance = (
             (
                 0.05
                 + (self.base_stats["special_chance"] * 0.0018)
-                + (self.attributes["explosive_punches"] * 0.044)
-                + (self.inscryptions["i4"] * 0.0065)
+                + (self.attributes.explosive_punches * 0.044)
+                + (self.inscryptions.i4 * 0.0065)
             )
             * (1 + (0.02 * self.gems["creation_node_#2"]))
         )
@@ -593,17 +654,24 @@ class Borge(Hunter):
         self.special_damage = (
             1.30
             + (self.base_stats["special_damage"] * 0.01)
-            + (self.attributes["explosive_punches"] * 0.08)
+            + (self.attributes.explosive_punches * 0.08)
         )
         # speed
-        self.speed = (
+        self._speed = (
             5
             - (self.base_stats["speed"] * 0.03)
-            - (self.inscryptions["i23"] * 0.04)
+            - (self.inscryptions.i23 * 0.04)
         )
         # lifesteal
-        self.lifesteal = (self.attributes["book_of_baal"] * 0.0111)
+        self.lifesteal = (self.attributes.book_of_baal * 0.0111)
         self.fires_of_war: float = 0
+        # effect coefficients that are fixed by the build
+        self._weakspot_mult = 1 - self.attributes.weakspot_analysis * 0.11
+        self._inhaler_coeff = self.attributes.lifedrain_inhalers * 0.0008
+        self._potion_healing = self.max_hp * (self.talents.unfair_advantage * 0.02)
+        self._stun_duration = self.talents.impeccable_impacts * 0.1
+        self._fow_duration = self.talents.fires_of_war * 0.1
+        self._recompute_stats()
 
     @staticmethod
     def load_dummy() -> dict:
@@ -688,40 +756,45 @@ class Borge(Hunter):
         Args:
             target (_type_): The enemy to attack.
         """
-        if random.random() < self.special_chance:
+        if random() < self.special_chance:
             damage = self.power * self.special_damage
             self.total_crits += 1
             self.total_extra_from_crits += (damage - self.power)
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} (crit)")
+            if self.sim.debug:
+                logging.debug(f"[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} (crit)")
         else:
             damage = self.power
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f}")
-        if self.mods["trample"] and not target.is_boss() and damage > target.max_hp:
+            if self.sim.debug:
+                logging.debug(f"[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f}")
+        if self.mods.trample and not target.is_boss and damage > target.max_hp:
             # Mod: Trample
             trample_kills = self.apply_trample(damage, current_target=target)
             if trample_kills > 1:
-                logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTRAMPLE {trample_kills} enemies")
+                if self.sim.debug:
+                    logging.debug(f"[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tTRAMPLE {trample_kills} enemies")
                 self.trample_kills += trample_kills
             else:
-                super(Borge, self).attack(target, damage)
+                super().attack(target, damage)
         else:
-            super(Borge, self).attack(target, damage)
+            super().attack(target, damage)
         self.total_damage += damage
         self.total_attacks += 1
 
-        #  on_attack() effects
-        self.heal_hp(damage * self.lifesteal, 'steal')
-        if random.random() < self.effect_chance and (LotH := self.talents["life_of_the_hunt"]):
+        #  on_attack() effects, heals are skipped at full hp since there is nothing to restore
+        if self.lifesteal and self.hp < self.max_hp:
+            self.heal_hp(damage * self.lifesteal, 'steal')
+        if (LotH := self.talents.life_of_the_hunt) and random() < self.effect_chance:
             # Talent: Life of the Hunt
             LotH_healing = damage * LotH * 0.06
-            self.heal_hp(LotH_healing, "loth")
+            if self.hp < self.max_hp:
+                self.heal_hp(LotH_healing, "loth")
             self.total_loth += LotH_healing
             self.total_effect_procs += 1
-        if random.random() < self.effect_chance and self.talents["impeccable_impacts"]:
+        if self.talents.impeccable_impacts and random() < self.effect_chance:
             # Talent: Impeccable Impacts, will call Hunter.apply_stun()
-            hpush(self.sim.queue, (0, 0, 'stun'))
+            hpush(self.sim.queue, (0, 0, EV_STUN))
             self.total_effect_procs += 1
-        if random.random() < self.effect_chance and self.talents["fires_of_war"]:
+        if self.talents.fires_of_war and random() < self.effect_chance:
             # Talent: Fires of War
             self.apply_fow()
             self.total_effect_procs += 1
@@ -735,20 +808,22 @@ class Borge(Hunter):
             is_crit (bool): Whether the attack was a critical hit or not.
         """
         if is_crit:
-            reduced_crit_damage = damage * (1 - self.attributes["weakspot_analysis"] * 0.11)
-            final_damage = super(Borge, self).receive_damage(reduced_crit_damage)
+            reduced_crit_damage = damage * self._weakspot_mult
+            final_damage = super().receive_damage(reduced_crit_damage)
         else:
-            final_damage = super(Borge, self).receive_damage(damage)
-        if (not self.is_dead()) and final_damage > 0:
-            helltouch_effect = (0.1 if (self.current_stage % 100 == 0 and self.current_stage > 0) else 1)
-            reflected_damage = final_damage * self.attributes["helltouch_barrier"] * 0.08 * helltouch_effect
+            final_damage = super().receive_damage(damage)
+        if (helltouch := self.attributes.helltouch_barrier) and self.hp > 0 and final_damage > 0:
+            # multiplied in the original order so the reflected damage stays bit-identical
+            reflected_damage = final_damage * helltouch * 0.08 * self._helltouch_effect
             self.total_helltouch += reflected_damage
             attacker.receive_damage(reflected_damage, is_reflected=True)
 
     def regen_hp(self) -> None:
-        """Regenerates hp according to the regen stat, modified by the `Lifedrain Inhalers` attribute.
+        """Regenerates hp according to the regen stat, modified by the `Lifedrain Inhalers` attribute. Nothing to do at full hp.
         """
-        inhaler_contrib = ((self.attributes["lifedrain_inhalers"] * 0.0008) * self.missing_hp)
+        if self.hp >= self.max_hp:
+            return
+        inhaler_contrib = self._inhaler_coeff * self.missing_hp
         regen_value = self.regen + inhaler_contrib
         self.total_inhaler += inhaler_contrib
         self.heal_hp(regen_value, 'regen')
@@ -757,10 +832,10 @@ class Borge(Hunter):
     def on_kill(self) -> None:
         """Actions to take when the hunter kills an enemy. Loot is handled by the parent class.
         """
-        super(Borge, self).on_kill()
-        if random.random() < self.effect_chance and (ua := self.talents["unfair_advantage"]):
+        super().on_kill()
+        if self.talents.unfair_advantage and random() < self.effect_chance:
             # Talent: Unfair Advantage
-            potion_healing = self.max_hp * (ua * 0.02)
+            potion_healing = self._potion_healing
             self.heal_hp(potion_healing, "potion")
             self.total_potion += potion_healing
             self.total_effect_procs += 1
@@ -772,7 +847,7 @@ class Borge(Hunter):
             enemy (Enemy): The enemy to stun.
         """
         stun_effect = 0.5 if is_boss else 1
-        stun_duration = self.talents['impeccable_impacts'] * 0.1 * stun_effect
+        stun_duration = self._stun_duration * stun_effect
         enemy.stun(stun_duration)
         self.total_stuntime_inflicted += stun_duration
 
@@ -782,9 +857,7 @@ class Borge(Hunter):
         Args:
             enemy (Enemy): The enemy to apply the effect to.
         """
-        stage_effect = 0.5 if self.current_stage % 100 == 0 and self.current_stage > 0 else 1
-        pog_effect = (self.talents["presence_of_god"] * 0.04) * stage_effect
-        enemy.hp = enemy.max_hp * (1 - pog_effect)
+        enemy.hp = enemy.max_hp * (1 - self._pog_effect)
 
     def apply_ood(self, enemy) -> None:
         """Apply the Omen of Defeat effect to an enemy.
@@ -792,15 +865,14 @@ class Borge(Hunter):
         Args:
             enemy (Enemy): The enemy to apply the effect to.
         """
-        stage_effect = 0.5 if self.current_stage % 100 == 0 and self.current_stage > 0 else 1
-        ood_effect = self.talents["omen_of_defeat"] * 0.08 * stage_effect
-        enemy.regen = enemy.regen * (1 - ood_effect)
+        enemy.regen = enemy.regen * (1 - self._ood_effect)
 
     def apply_fow(self) -> None:
         """Apply the temporaryFires of War effect to Borge.
         """
-        self.fires_of_war = self.talents["fires_of_war"] * 0.1
-        logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\t[FoW]\t{self.fires_of_war:>6.2f} sec')
+        self.fires_of_war = self._fow_duration
+        if self.sim.debug:
+            logging.debug(f'[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\t[FoW]\t{self.fires_of_war:>6.2f} sec')
 
     def apply_trample(self, damage: float, current_target) -> int:
         """Apply the Trample effect to a number of enemies.
@@ -822,70 +894,47 @@ class Borge(Hunter):
             # make sure to kill current target first to properly manage the simulation queue
             current_target.kill()
             trample_kills += 1
-            alive_index = [i for i, e in enumerate(enemies) if not e.is_dead()]
-            for i in alive_index[:trample_power]:
-                enemies[i].kill()
+            for e in islice((e for e in enemies if e.hp > 0), trample_power):
+                e.kill()
                 trample_kills += 1
             self.sim.refresh_enemies()
         return trample_kills
 
     ### UTILITY
+    def _recompute_stats(self) -> None:
+        """Derive the stats that only change with stage progression from their base values. Accounts for the Atlas Protocol
+        attribute, the boss stage penalties of Presence of God, Omen of Defeat and Helltouch Barrier and the Attraction gem
+        catch-up effect. Called on creation and whenever the current stage changes.
+        """
+        is_boss_stage = self.current_stage % 100 == 0 and self.current_stage > 0
+        stage_effect = 0.5 if is_boss_stage else 1
+        self._pog_effect = (self.talents.presence_of_god * 0.04) * stage_effect
+        self._ood_effect = self.talents.omen_of_defeat * 0.08 * stage_effect
+        self._helltouch_effect = 0.1 if is_boss_stage else 1
+        self._catch_up_mult = (1.08 ** self.gems["attraction_catch-up"]) ** (1 + (self.gems["attraction_gem"] * 0.1) - 0.1) if self.catching_up else 1
+        self._stage_power = self._power * self._catch_up_mult
+        self.damage_reduction = (self._damage_reduction + self.attributes.atlas_protocol * 0.007) if is_boss_stage else self._damage_reduction
+        self._damage_taken_mult = 1 - self.damage_reduction
+        self.effect_chance = (self._effect_chance + self.attributes.atlas_protocol * 0.014) if is_boss_stage else self._effect_chance
+        self.special_chance = (self._special_chance + self.attributes.atlas_protocol * 0.025) if is_boss_stage else self._special_chance
+        self._stage_speed = ((self._speed * (1 - self.attributes.atlas_protocol * 0.04)) if is_boss_stage else self._speed) / self._catch_up_mult
+
     @property
     def power(self) -> float:
-        """Getter for the power attribute. Accounts for the Born for Battle effect.
+        """Getter for the power attribute. Accounts for the Born for Battle effect, which depends on the current hp and is
+        therefore the only part that isn't cached.
 
         Returns:
             float: The power of the hunter.
         """
+        if not self.attributes.born_for_battle:
+            return self._stage_power
         return (
             self._power
-            * (1 + (self.missing_hp_pct * self.attributes["born_for_battle"] * 0.001))
-            * ((1.08 ** self.gems["attraction_catch-up"]) ** (1 + (self.gems["attraction_gem"] * 0.1) - 0.1) if self.catching_up else 1)
+            * (1 + (self.missing_hp_pct * self.attributes.born_for_battle * 0.001))
+            * self._catch_up_mult
         )
 
-    @power.setter
-    def power(self, value: float) -> None:
-        self._power = value
-
-    @property
-    def damage_reduction(self) -> float:
-        """Getter for the damage_reduction attribute. Accounts for the Atlas Protocol attribute.
-
-        Returns:
-            float: The damage reduction of the hunter.
-        """
-        return (self._damage_reduction + self.attributes["atlas_protocol"] * 0.007) if (self.current_stage % 100 == 0 and self.current_stage > 0) else self._damage_reduction
-
-    @damage_reduction.setter
-    def damage_reduction(self, value: float) -> None:
-        self._damage_reduction = value
-
-    @property
-    def effect_chance(self) -> float:
-        """Getter for the effect_chance attribute. Accounts for the Atlas Protocol attribute.
-
-        Returns:
-            float: The effect chance of the hunter.
-        """
-        return (self._effect_chance + self.attributes["atlas_protocol"] * 0.014) if (self.current_stage % 100 == 0 and self.current_stage > 0) else self._effect_chance
-
-    @effect_chance.setter
-    def effect_chance(self, value: float) -> None:
-        self._effect_chance = value
-
-    @property
-    def special_chance(self) -> float:
-        """Getter for the special_chance attribute. Accounts for the Atlas Protocol attribute.
-
-        Returns:
-            float: The special chance of the hunter.
-        """
-        return (self._special_chance + self.attributes["atlas_protocol"] * 0.025) if (self.current_stage % 100 == 0 and self.current_stage > 0) else self._special_chance
-
-    @special_chance.setter
-    def special_chance(self, value: float) -> None:
-        self._special_chance = value
-
     @property
     def speed(self) -> float:
         """Getter for the speed attribute. Accounts for the Fires of War effect and resets it afterwards.
@@ -893,23 +942,18 @@ class Borge(Hunter):
         Returns:
             float: The speed of the hunter.
         """
-        current_speed = (self._speed * (1 - self.attributes["atlas_protocol"] * 0.04)) if (self.current_stage % 100 == 0 and self.current_stage > 0) else self._speed
-        current_speed /= (1.08 ** self.gems["attraction_catch-up"]) ** (1 + (self.gems["attraction_gem"] * 0.1) - 0.1) if self.catching_up else 1
-        current_speed -= self.fires_of_war
+        current_speed = self._stage_speed - self.fires_of_war
         self.fires_of_war = 0
         return current_speed
 
-    @speed.setter
-    def speed(self, value: float) -> None:
-        self._speed = value
-
     def get_results(self) -> List:
         """Fetch the hunter results for end-of-run statistics.
 
         Returns:
             List: List of all collected stats.
         """
-        return super(Borge, self).get_results() | {
+        res = super().get_results()
+        res.update({
             'crits': self.total_crits,
             'extra_damage_from_crits': self.total_extra_from_crits,
             'helltouch_barrier': self.total_helltouch,
@@ -917,7 +961,8 @@ class Borge(Hunter):
             'trample_kills': self.trample_kills,
             'life_of_the_hunt_healing': self.total_loth,
             'unfair_advantage_healing': self.total_potion,
-        }
+        })
+        return res
 
 class Ozzy(Hunter):
     ### SETUP
@@ -1035,12 +1080,12 @@ class Ozzy(Hunter):
     }
 
     def __init__(self, config_dict: Dict):
-        super(Ozzy, self).__init__(name='Ozzy')
+        super().__init__(name='Ozzy')
         self.__create__(config_dict)
         self.trickster_charges: int = 0
         self.crippling_on_target: int = 0
         self.empowered_regen: int = 0
-        self.attack_queue: List = []
+        self.attack_queue: deque = deque()
 
         # statistics
         # offence
@@ -1073,17 +1118,17 @@ class Ozzy(Hunter):
                 16
                 + (self.base_stats["hp"] * (2 + 0.03 * (self.base_stats["hp"] // 5)))
             )
-            * (1 + (self.attributes["living_off_the_land"] * 0.02))
+            * (1 + (self.attributes.living_off_the_land * 0.02))
             * (1 + (self.relics["disk_of_dawn"] * 0.02))
         )
         self.hp = self.max_hp
         # power
-        self.power = (
+        self._power = (
             (
                 2
                 + (self.base_stats["power"] * (0.3 + 0.01 * (self.base_stats["power"] // 10)))
             )
-            * (1 + (self.attributes["exo_piercers"] * 0.012))
+            * (1 + (self.attributes.exo_piercers * 0.012))
             * (1 + (self.relics["bee_gone_companion_drone"] * 0.02))
             * (1 + (0.03 * self.gems["innovation_node_#3"]))
         )
@@ -1093,50 +1138,59 @@ class Ozzy(Hunter):
                 0.1
                 + (self.base_stats["regen"] * (0.05 + 0.01 * (self.base_stats["regen"] // 30)))
             )
-            * (1 + (self.attributes["living_off_the_land"] * 0.02))
+            * (1 + (self.attributes.living_off_the_land * 0.02))
         )
-        self.damage_reduction = (
+        self._damage_reduction = (
             0
             + (self.base_stats["damage_reduction"] * 0.0035)
-            + (self.attributes["wings_of_ibu"] * 0.026)
-            + (self.inscryptions["i37"] * 0.0111)
+            + (self.attributes.wings_of_ibu * 0.026)
+            + (self.inscryptions.i37 * 0.0111)
         )
         # evade_chance
         self.evade_chance = (
             0.05
             + (self.base_stats["evade_chance"] * 0.0062)
-            + (self.attributes["wings_of_ibu"] * 0.005)
+            + (self.attributes.wings_of_ibu * 0.005)
         )
         # effect_chance
         self.effect_chance = (
             0.04
             + (self.base_stats["effect_chance"] * 0.0035)
-            + (self.attributes["extermination_protocol"] * 0.028)
-            + (self.inscryptions["i31"] * 0.006)
+            + (self.attributes.extermination_protocol * 0.028)
+            + (self.inscryptions.i31 * 0.006)
         )
         # special_chance
-        self.special_chance = (
+        self._special_chance = (
             (
                 0.05
                 + (self.base_stats["special_chance"] * 0.0038)
-                + (self.inscryptions["i40"] * 0.005)
+                + (self.inscryptions.i40 * 0.005)
                 + (0.03 * self.gems["innovation_node_#3"])
             )
         )
         # special_damage
-        self.special_damage = (
+        self._special_damage = (
             0.25
             + (self.base_stats["special_damage"] * 0.01)
         )
         # speed
-        self.speed = (
+        self._speed = (
             4
             - (self.base_stats["speed"] * 0.02)
-            - (self.talents["thousand_needles"] * 0.06)
-            - (self.inscryptions["i36"] * 0.03)
+            - (self.talents.thousand_needles * 0.06)
+            - (self.inscryptions.i36 * 0.03)
         )
         # lifesteal
-        self.lifesteal = (self.attributes["shimmering_scorpion"] * 0.033)
+        self.lifesteal = (self.attributes.shimmering_scorpion * 0.033)
+        # effect coefficients that are fixed by the build
+        self._half_effect_chance = self.effect_chance / 2
+        self._echo_mult = self.talents.echo_bullets * 0.05
+        self._vectid_mult = 1 + (self.attributes.vectid_elixir * 0.15)
+        self._potion_healing = self.max_hp * (self.talents.unfair_advantage * 0.02)
+        self._stun_duration = self.talents.thousand_needles * 0.05
+        self._snek_mult = 1 - self.attributes.soul_of_snek * 0.088
+        self._medusa_regen = self.regen * self.attributes.gift_of_medusa * 0.05
+        self._recompute_stats()
 
     @staticmethod
     def load_dummy() -> dict:
@@ -1215,69 +1269,69 @@ class Ozzy(Hunter):
         """
         # method handles all attacks: normal and triggered
         if not self.attack_queue: # normal attacks
-            if random.random() < (self.effect_chance / 2) and self.talents["tricksters_boon"]:
+            if self.talents.tricksters_boon and random() < self._half_effect_chance:
                 # Talent: Trickster's Boon
                 self.trickster_charges += 1
                 self.total_effect_procs += 1
-                logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTRICKSTER")
-            if random.random() < self.special_chance:
+                if self.sim.debug:
+                    logging.debug(f"[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tTRICKSTER")
+            if random() < self.special_chance:
                 # Stat: Multi-Strike
-                self.attack_queue.append('(MS)')
-                hpush(self.sim.queue, (0, 1, 'hunter_special'))
-            if random.random() < self.effect_chance and self.talents["thousand_needles"]:
+                self.attack_queue.append(ATK_MS)
+                hpush(self.sim.queue, (0, 1, EV_HUNTER_SPECIAL))
+            if self.talents.thousand_needles and random() < self.effect_chance:
                 # Talent: Thousand Needles, will call Hunter.apply_stun(). Only Ozzy's main attack can stun.
-                hpush(self.sim.queue, (0, 0, 'stun'))
+                hpush(self.sim.queue, (0, 0, EV_STUN))
                 self.total_effect_procs += 1
-            if random.random() < (self.effect_chance / 2) and self.talents["echo_bullets"]:
+            if self.talents.echo_bullets and random() < self._half_effect_chance:
                 # Talent: Echo Bullets
-                self.attack_queue.append('(ECHO)')
-                hpush(self.sim.queue, (0, 2, 'hunter_special'))
+                self.attack_queue.append(ATK_ECHO)
+                hpush(self.sim.queue, (0, 2, EV_HUNTER_SPECIAL))
             damage = self.power
             self.total_attacks += 1
-            atk_type = ''
+            atk_type = ATK_MAIN
         else: # triggered attacks
-            atk_type = self.attack_queue.pop(0)
-            match atk_type:
-                case '(MS)':
-                    damage = self.power * self.special_damage
-                    self.total_ms_extra_damage += damage
-                    self.total_multistrikes += 1
-                case '(ECHO)':
-                    if random.random() < self.special_chance:
-                        # Stat: Multi-Strike
-                        self.attack_queue.append('(ECHO-MS)')
-                        hpush(self.sim.queue, (0, 3, 'hunter_special'))
-                    damage = self.power * (self.talents["echo_bullets"] * 0.05)
-                    self.total_echo += 1
-                case '(ECHO-MS)':
-                    damage = self.power * self.special_damage
-                    self.total_ms_extra_damage += damage
-                    self.total_multistrikes += 1
-                case _:
-                    raise ValueError(f'Unknown attack type: {atk_type}')
-        # omen of decay
-        omen_effect = 0.1 if self.current_stage % 100 == 0 and self.current_stage > 0 else 1
-        omen_damage = target.hp * (self.talents["omen_of_decay"] * 0.008) * omen_effect
+            atk_type = self.attack_queue.popleft()
+            if atk_type == ATK_MS or atk_type == ATK_ECHO_MS:
+                damage = self._ms_damage
+                self.total_ms_extra_damage += damage
+                self.total_multistrikes += 1
+            elif atk_type == ATK_ECHO:
+                if random() < self.special_chance:
+                    # Stat: Multi-Strike
+                    self.attack_queue.append(ATK_ECHO_MS)
+                    hpush(self.sim.queue, (0, 3, EV_HUNTER_SPECIAL))
+                damage = self._echo_damage
+                self.total_echo += 1
+            else:
+                raise ValueError(f'Unknown attack type: {atk_type}')
+        # omen of decay and crippling shots, skipped when they can't add anything
+        omen_damage = target.hp * self._omen_coeff if self._omen_coeff else 0
         omen_final = damage + omen_damage
-        # crippling shots
-        cripple_damage = omen_final * (1 + (self.crippling_on_target * 0.03))
-        self.crippling_on_target = 0
-        logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{cripple_damage:>6.2f} {atk_type} OMEN: {omen_damage:>6.2f}")
-        super(Ozzy, self).attack(target, cripple_damage)
+        if self.crippling_on_target:
+            cripple_damage = omen_final * (1 + (self.crippling_on_target * 0.03))
+            self.crippling_on_target = 0
+        else:
+            cripple_damage = omen_final
+        if self.sim.debug:
+            logging.debug(f"[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{cripple_damage:>6.2f} {atk_type_names[atk_type]} OMEN: {omen_damage:>6.2f}")
+        super().attack(target, cripple_damage)
         self.total_decay_damage += omen_damage
         self.total_cripple_extra_damage += (cripple_damage - omen_final)
-        if atk_type == '':
+        if atk_type == ATK_MAIN:
             self.total_damage += cripple_damage
 
         # on_attack() effects
         # crippling shots and omen of decay inflict _extra damage_ that does not count towards lifesteal
-        self.heal_hp(damage * self.lifesteal, 'steal')
-        if random.random() < self.effect_chance and (cs := self.talents["crippling_shots"]):
+        if self.lifesteal and self.hp < self.max_hp:
+            self.heal_hp(damage * self.lifesteal, 'steal')
+        if (cs := self.talents.crippling_shots) and random() < self.effect_chance:
             # Talent: Crippling Shots, can proc on any attack
             self.crippling_on_target += cs
-            logging.debug(f"[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tCRIPPLE\t+{cs}")
+            if self.sim.debug:
+                logging.debug(f"[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tCRIPPLE\t+{cs}")
             self.total_effect_procs += 1
-        if target.is_dead():
+        if target.hp <= 0:
             self.on_kill()
 
     def receive_damage(self, _, damage: float, is_crit: bool) -> None:
@@ -1291,11 +1345,12 @@ class Ozzy(Hunter):
         if self.trickster_charges:
             self.trickster_charges -= 1
             self.total_trickster_evades += 1
-            logging.debug(f'[{self.name:>{hunter_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tEVADE (TRICKSTER)')
+            if self.sim.debug:
+                logging.debug(f'[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tEVADE (TRICKSTER)')
         else:
-            _ = super(Ozzy, self).receive_damage(damage)
+            _ = super().receive_damage(damage)
             if is_crit:
-                if (dod := self.attributes["dance_of_dashes"]) and random.random() < dod * 0.15:
+                if (dod := self.attributes.dance_of_dashes) and random() < dod * 0.15:
                     # Talent: Dance of Dashes
                     self.trickster_charges += 1
                     self.total_effect_procs += 1
@@ -1305,18 +1360,20 @@ class Ozzy(Hunter):
         """
         regen_value = self.regen
         if self.empowered_regen > 0:
-            regen_value *= 1 + (self.attributes["vectid_elixir"] * 0.15)
+            regen_value *= self._vectid_mult
             self.empowered_regen -= 1
-        self.heal_hp(regen_value, 'regen')
+        # empowered ticks are used up even at full hp
+        if self.hp < self.max_hp:
+            self.heal_hp(regen_value, 'regen')
 
     ### SPECIALS
     def on_kill(self) -> None:
         """Actions to take when the hunter kills an enemy. Loot is handled by the parent class.
         """
-        super(Ozzy, self).on_kill()
-        if random.random() < self.effect_chance and (ua := self.talents["unfair_advantage"]):
+        super().on_kill()
+        if self.talents.unfair_advantage and random() < self.effect_chance:
             # Talent: Unfair Advantage
-            potion_healing = self.max_hp * (ua * 0.02)
+            potion_healing = self._potion_healing
             self.heal_hp(potion_healing, "potion")
             self.total_potion += potion_healing
             self.total_effect_procs += 1
@@ -1330,7 +1387,7 @@ class Ozzy(Hunter):
             enemy (Enemy): The enemy to stun.
         """
         stun_effect = 0.5 if is_boss else 1
-        stun_duration = self.talents['thousand_needles'] * 0.05 * stun_effect
+        stun_duration = self._stun_duration * stun_effect
         enemy.stun(stun_duration)
         self.total_stuntime_inflicted += stun_duration
 
@@ -1340,8 +1397,7 @@ class Ozzy(Hunter):
         Args:
             enemy (Enemy): The enemy to apply the effect to.
         """
-        ood_effect = self.attributes["soul_of_snek"] * 0.088
-        enemy.regen = enemy.regen * (1 - ood_effect)
+        enemy.regen = enemy.regen * self._snek_mult
 
     def apply_medusa(self, enemy) -> None:
         """Apply the Gift of Medusa effect to an enemy.
@@ -1349,79 +1405,28 @@ class Ozzy(Hunter):
         Args:
             enemy (Enemy): The enemy to apply the effect to.
         """
-        enemy.regen -= self.regen * self.attributes["gift_of_medusa"] * 0.05
+        enemy.regen -= self._medusa_regen
 
-    @property
-    def power(self) -> float:
-        """Getter for the power attribute. Accounts for the Deal with Death effect.
-
-        Returns:
-            float: The power of the hunter.
+    def _recompute_stats(self) -> None:
+        """Derive the stats that only change with revives and stage progression from their base values. Accounts for the
+        Deal with Death and Cycle of Death effects, the Omen of Decay boss stage penalty and the Attraction gem catch-up effect.
+        Called on creation, on revive and whenever the current stage changes.
         """
-        return (
+        omen_effect = 0.1 if self.current_stage % 100 == 0 and self.current_stage > 0 else 1
+        self._omen_coeff = (self.talents.omen_of_decay * 0.008) * omen_effect
+        catch_up_mult = (1.08 ** self.gems["attraction_catch-up"]) ** (1 + (self.gems["attraction_gem"] * 0.1) - 0.1) if self.catching_up else 1
+        self.power = (
             self._power
-            * (1 + (self.attributes["deal_with_death"] * 0.02 * self.times_revived))
-            * ((1.08 ** self.gems["attraction_catch-up"]) ** (1 + (self.gems["attraction_gem"] * 0.1) - 0.1) if self.catching_up else 1)
-        )
-
-    @power.setter
-    def power(self, value: float) -> None:
-        self._power = value
-    
-    @property
-    def damage_reduction(self) -> float:
-        """Getter for the damage_reduction attribute. Accounts for the Deal with Death effect.
-
-        Returns:
-            float: The damage_reduction of the hunter.
-        """
-        return self._damage_reduction + (self.attributes["deal_with_death"] * 0.016 * self.times_revived)
-
-    @damage_reduction.setter
-    def damage_reduction(self, value: float) -> None:
-        self._damage_reduction = value
-
-    @property
-    def special_chance(self) -> float:
-        """Getter for the special_chance attribute. Accounts for the Cycle of Death effect.
-
-        Returns:
-            float: The special_chance of the hunter.
-        """
-        return self._special_chance + (self.times_revived * self.attributes["cycle_of_death"] * 0.023)
-
-    @special_chance.setter
-    def special_chance(self, value: float) -> None:
-        self._special_chance = value
-
-    @property
-    def special_damage(self) -> float:
-        """Getter for the special_damage attribute. Accounts for the Cycle of Death effect.
-
-        Returns:
-            float: The special_chance of the hunter.
-        """
-        return self._special_damage + (self.times_revived * self.attributes["cycle_of_death"] * 0.02)
-
-    @special_damage.setter
-    def special_damage(self, value: float) -> None:
-        self._special_damage = value
-
-    @property
-    def speed(self) -> float:
-        """Getter for the speed attribute. Accounts for the Attraction gem catch-up effect.
-
-        Returns:
-            float: The speed of the hunter.
-        """
-        return (
-            self._speed
-            / ((1.08 ** self.gems["attraction_catch-up"]) ** (1 + (self.gems["attraction_gem"] * 0.1) - 0.1) if self.catching_up else 1)
+            * (1 + (self.attributes.deal_with_death * 0.02 * self.times_revived))
+            * catch_up_mult
         )
-
-    @speed.setter
-    def speed(self, value: float) -> None:
-        self._speed = value
+        self.damage_reduction = self._damage_reduction + (self.attributes.deal_with_death * 0.016 * self.times_revived)
+        self._damage_taken_mult = 1 - self.damage_reduction
+        self.special_chance = self._special_chance + (self.times_revived * self.attributes.cycle_of_death * 0.023)
+        self.special_damage = self._special_damage + (self.times_revived * self.attributes.cycle_of_death * 0.02)
+        self.speed = self._speed / catch_up_mult
+        self._ms_damage = self.power * self.special_damage
+        self._echo_damage = self.power * self._echo_mult
 
     def get_results(self) -> List:
         """Fetch the hunter results for end-of-run statistics.
@@ -1429,7 +1434,8 @@ class Ozzy(Hunter):
         Returns:
             List: List of all collected stats.
         """
-        return super(Ozzy, self).get_results() | {
+        res = super().get_results()
+        res.update({
             'multistrikes': self.total_multistrikes,
             'extra_damage_from_ms': self.total_ms_extra_damage,
             'unfair_advantage_healing': self.total_potion,
@@ -1438,7 +1444,8 @@ class Ozzy(Hunter):
             'extra_damage_from_crippling_strikes': self.total_cripple_extra_damage,
             'medusa_kills': self.medusa_kills,
             'echo_bullets': self.total_echo,
-        }
+        })
+        return res
 
 
 if __name__ == "__main__":
@@ -1,26 +1,69 @@
 import logging
 import statistics
-from collections import Counter, defaultdict
-from concurrent.futures import ProcessPoolExecutor
+from collections import Counter, defaultdict, deque
+from contextlib import nullcontext
 from datetime import timedelta
 from heapq import heappop as hpop
 from heapq import heappush as hpush
-from itertools import chain
-from math import floor
+from heapq import heapreplace as hreplace
+from itertools import repeat
+from math import floor, fsum, isfinite, sqrt
+from multiprocessing.pool import Pool
 from string import capwords
-from typing import Dict, Generator, List, Tuple
+from typing import Deque, Dict, Generator, List, Tuple
 
 import rich
-from hunters import Borge, Hunter, Ozzy, hunter_name_spacing
+from hunters import EV_ENEMY, EV_ENEMY_SPECIAL, EV_HUNTER, EV_HUNTER_SPECIAL, EV_REGEN, EV_STUN, Borge, Hunter, Ozzy, event_names, hunter_name_spacing
 from tqdm import tqdm
 from units import Boss, Enemy
 
 
-def sim_worker(hunter_class: Hunter, config_dict: Dict) -> None:
+# declare which stats belong to which categories, in display order
+output_format: Dict[str, Tuple[str, ...]] = {
+    'main': ('elapsed_time', 'kills', 'first_revive_stage', 'second_revive_stage', 'enrage_stacks:_1st_boss', 'enrage_stacks:_2nd_boss', 'enrage_stacks:_3rd_boss'),
+    'offence': ('attacks', 'damage', 'crits', 'extra_damage_from_crits', 'multistrikes', 'extra_damage_from_ms', 'decay_damage', 'extra_damage_from_crippling_shots'),
+    'sustain': ('damage_taken', 'regenerated_hp', 'attacks_suffered', 'lifesteal'),
+    'defence': ('evades', 'trickster_evades', 'mitigated_damage'),
+    'effects': ('effect_procs', 'stun_duration_inflicted', 'helltouch_barrier', 'helltouch_kills', 'trample_kills', 'medusa_kills', 'life_of_the_hunt_healing', 'echo_bullets', 'unfair_advantage_healing'),
+    'loot': ('loot_per_hour',),
+}
+
+# builds simulated by a worker process, handed over once per process by init_sim_worker()
+_worker_builds: Tuple[Tuple[type, Dict], ...] = ()
+
+def init_sim_worker(builds: Tuple[Tuple[type, Dict], ...]) -> None:
+    """Initializer for worker processes, stores the builds to simulate so they are only pickled once per process.
+
+    Args:
+        builds (Tuple[Tuple[type, Dict], ...]): Hunter class and build config dictionary of every build the pool will simulate.
+    """
+    global _worker_builds
+    _worker_builds = builds
+
+def sim_worker(build_index: int) -> Dict:
     """Worker process for running simulations in parallel.
+
+    Args:
+        build_index (int): Index of the build to simulate in the builds handed to init_sim_worker().
     """
+    hunter_class, config_dict = _worker_builds[build_index]
     return Simulation(hunter_class(config_dict)).run()
 
+def mean_stdev(data: List[float]) -> Tuple[float, float]:
+    """Compute the mean and sample standard deviation of a list of values, sharing the mean between both.
+
+    Args:
+        data (List[float]): The values to aggregate.
+
+    Returns:
+        Tuple[float, float]: Mean and sample standard deviation. The deviation of a single value is 0.
+    """
+    n = len(data)
+    mean = fsum(data) / n
+    if n < 2:
+        return mean, 0.0
+    return mean, sqrt(fsum((x - mean) ** 2 for x in data) / (n - 1))
+
 class SimulationManager():
     def __init__(self, hunter_config_dict: Dict) -> None:
         self.hunter_config_dict = hunter_config_dict
@@ -34,7 +77,8 @@ class SimulationManager():
             num_processes (int, optional): Number of processes to use for parallelisation. Defaults to -1, which processes runs sequentially.
             show_stats (bool, optional): Whether to show combat statistics after the simulation, only the stage breakdown and loot. Defaults to True.
         """
-        res = self.__run_sims(repetitions, num_processes)
+        with self.__make_pool(num_processes, self.hunter_config_dict) as pool:
+            res = self.__run_sims(repetitions, pool, num_processes)
         avg, std = self.prepare_results(res)
         self.display_stats(avg, std, show_stats)
 
@@ -47,48 +91,74 @@ class SimulationManager():
             num_processes (int, optional): Number of processes to use for parallelisation. Defaults to -1, which processes runs sequentially.
             show_stats (bool, optional): Whether to show combat statistics after the simulation, only the stage breakdown and loot. Defaults to True.
         """
-        print('BUILD 1:')
-        res = self.__run_sims(repetitions, num_processes)
-        self.hunter_config_dict = compare_dict
-        print('BUILD 2:')
-        res_c = self.__run_sims(repetitions, num_processes)
+        # one pool serves both builds, so worker start-up is only paid once
+        with self.__make_pool(num_processes, self.hunter_config_dict, compare_dict) as pool:
+            print('BUILD 1:')
+            res = self.__run_sims(repetitions, pool, num_processes, build_index=0)
+            self.hunter_config_dict = compare_dict
+            print('BUILD 2:')
+            res_c = self.__run_sims(repetitions, pool, num_processes, build_index=1)
         (res, _), (res_c, _) = self.prepare_results(res), self.prepare_results(res_c)
         res, res_c = self.make_comparable(res, res_c)
         self.display_stats(res, res_c, show_stats)
 
-    def __run_sims(self, repetitions: int, num_processes: int = -1) -> dict:
+    @staticmethod
+    def __hunter_class(config_dict: Dict) -> type:
+        """Get the hunter class a build config is meant for.
+
+        Args:
+            config_dict (Dict): Build config dictionary.
+
+        Returns:
+            type: The Hunter subclass of the build.
+        """
+        match config_dict["meta"]["hunter"].lower():
+            case "borge":
+                return Borge
+            case "ozzy":
+                return Ozzy
+
+    @classmethod
+    def __make_pool(cls, num_processes: int, *config_dicts: Dict) -> Pool | nullcontext:
+        """Create the worker pool for parallel simulations, with the given builds handed to every worker up front.
+
+        Args:
+            num_processes (int): Number of processes to use for parallelisation.
+            *config_dicts (Dict): Build config dictionaries, addressed by their position when running simulations.
+
+        Returns:
+            Pool | nullcontext: The worker pool, or an empty context for sequential processing.
+        """
+        if num_processes <= 0:
+            return nullcontext()
+        builds = tuple((cls.__hunter_class(c), c) for c in config_dicts)
+        return Pool(num_processes, initializer=init_sim_worker, initargs=(builds,))
+
+    def __run_sims(self, repetitions: int, pool: Pool = None, num_processes: int = 1, build_index: int = 0) -> dict:
         """Run simulations and return results.
 
         Args:
             repetitions (int): Number of simulations to run.
-            threaded (int, optional): Number of processes to use for parallelisation. Defaults to -1, which processes runs sequentially.
-
-        Raises:
-            ValueError: Unknown hunter type found in config
+            pool (Pool, optional): Worker pool from __make_pool() to run the simulations on. Defaults to None, which processes runs sequentially.
+            num_processes (int, optional): Number of processes the pool was created with, used to size the task chunks. Defaults to 1.
+            build_index (int, optional): Position of the current build among the builds the pool was created with. Defaults to 0.
 
         Returns:
             dict: Results of simulations.
         """
         # prepare sim instances to run
-        match self.hunter_config_dict["meta"]["hunter"].lower():
-            case "borge":
-                hunter_class = Borge
-            case "ozzy":
-                hunter_class = Ozzy
+        hunter_class = self.__hunter_class(self.hunter_config_dict)
         hunter_class(self.hunter_config_dict).show_build()
-        if num_processes > 0:
-            with ProcessPoolExecutor(max_workers=num_processes) as e:
-                self.results = list(tqdm(e.map(sim_worker, [hunter_class] * repetitions, [self.hunter_config_dict] * repetitions), total=repetitions, leave=True))
+        if pool is not None:
+            # hand out several runs per task so the per-task IPC overhead is amortised, results are collected in completion order
+            chunksize = max(1, repetitions // (num_processes * 4))
+            self.results = list(tqdm(pool.imap_unordered(sim_worker, repeat(build_index, repetitions), chunksize=chunksize), total=repetitions, leave=True))
         else:
-            for _ in tqdm(range(repetitions), leave=False):
-                self.results.append(Simulation(hunter_class(self.hunter_config_dict)).run())
+            # rebuilt on every call so compare_against() does not carry build 1's runs into build 2
+            self.results = [Simulation(hunter_class(self.hunter_config_dict)).run() for _ in tqdm(range(repetitions), leave=False)]
         
-        # prepare results
-        res = {'hunter': hunter_class}
-        for d in self.results:
-            for k, v in d.items():
-                res.setdefault(k, []).append(v)
-        return res
+        # prepare results: every run reports the same keys, so transpose them into one list per key
+        return {'hunter': hunter_class, **{k: [d[k] for d in self.results] for k in self.results[0]}}
 
     @classmethod
     def prepare_results(cls, res_dict: Dict) -> Tuple[Dict, Dict]:
@@ -103,45 +173,32 @@ class SimulationManager():
         res_avg, res_std = {}, {}
         hunter = res_dict.pop('hunter')
         # Enrages
-        enrage = {'enrage_stacks:_1st_boss': [], 'enrage_stacks:_2nd_boss': [], 'enrage_stacks:_3rd_boss': []}
-        for e in res_dict.pop('enrage_log'):
-            try:
-                enrage['enrage_stacks:_1st_boss'].append(e[0])
-                enrage['enrage_stacks:_2nd_boss'].append(e[1])
-                enrage['enrage_stacks:_3rd_boss'].append(e[2])
-            except:
-                pass
-        res_dict = res_dict | enrage
+        enrage_log = res_dict.pop('enrage_log')
+        res_dict = res_dict | {
+            'enrage_stacks:_1st_boss': [e[0] for e in enrage_log if len(e) > 0],
+            'enrage_stacks:_2nd_boss': [e[1] for e in enrage_log if len(e) > 1],
+            'enrage_stacks:_3rd_boss': [e[2] for e in enrage_log if len(e) > 2],
+        }
         # Revives
-        revives = {'first_revive_stage': [], 'second_revive_stage': []}
-        for e in res_dict.pop("revive_log"):
-            try:
-                revives['first_revive_stage'].append(e[0])
-                revives['second_revive_stage'].append(e[1])
-            except:
-                pass
-        res_dict = res_dict | revives
+        revive_log = res_dict.pop('revive_log')
+        res_dict = res_dict | {
+            'first_revive_stage': [e[0] for e in revive_log if len(e) > 0],
+            'second_revive_stage': [e[1] for e in revive_log if len(e) > 1],
+        }
         # Loot
-        res_dict['loot_per_hour'] = [(res_dict['total_loot'][i] / (res_dict['elapsed_time'][i] / (60 * 60))) for i in range(len(res_dict['total_loot']))]
+        res_dict['loot_per_hour'] = [loot / (time / (60 * 60)) for loot, time in zip(res_dict['total_loot'], res_dict['elapsed_time'])]
         # compute averages and standard deviations
         if len(res_dict['elapsed_time']) > 1:
-            avg = {k: statistics.fmean(v) for k, v in res_dict.items() if v and type(v[0]) != list}
-            std = {k: statistics.stdev(v) for k, v in res_dict.items() if v and type(v[0]) != list}
+            avg, std = {}, {}
+            for k, v in res_dict.items():
+                if v and type(v[0]) != list:
+                    avg[k], std[k] = mean_stdev(v)
         else:
             avg = dict()
             for k, v in res_dict.items():
                 if type(v) == list and len(v) == 1:
                     avg[k] = v[0]
             std = {k: 0 for k in res_dict}
-        # declare which stats belong to which categories
-        output_format = {
-            'main': ['elapsed_time', 'kills', 'first_revive_stage', 'second_revive_stage', 'enrage_stacks:_1st_boss', 'enrage_stacks:_2nd_boss', 'enrage_stacks:_3rd_boss'],
-            'offence': ['attacks', 'damage', 'crits', 'extra_damage_from_crits', 'multistrikes', 'extra_damage_from_ms', 'decay_damage', 'extra_damage_from_crippling_shots'],
-            'sustain': ['damage_taken', 'regenerated_hp', 'attacks_suffered', 'lifesteal'],
-            'defence': ['evades', 'trickster_evades', 'mitigated_damage'],
-            'effects': ['effect_procs', 'stun_duration_inflicted', 'helltouch_barrier', 'helltouch_kills', 'trample_kills', 'medusa_kills', 'life_of_the_hunt_healing', 'echo_bullets', 'unfair_advantage_healing'],
-            'loot': ['loot_per_hour'],
-        }
         for k, v in output_format.items():
             res_avg[k] = {val: avg[val] for val in v if val in avg}
             res_std[k] = {val: std[val] for val in v if val in std}
@@ -152,9 +209,10 @@ class SimulationManager():
         res_std['effects']['stun_duration_inflicted'] = timedelta(seconds=round(std['stun_duration_inflicted']))
         res_avg['loot'].update({'best_lph': max(res_dict['loot_per_hour']), 'worst_lph': min(res_dict['loot_per_hour'])})
         res_std['loot'].update({'best_lph': 0, 'worst_lph': 0})
+        stage_counts = Counter(res_dict['final_stage'])
         res_avg['final_stage'] = {
-            'aggregates': {'highest': max(res_dict['final_stage']), 'median': floor(statistics.median(res_dict['final_stage'])), 'average': floor(statistics.mean(res_dict['final_stage'])), 'lowest': min(res_dict['final_stage'])},
-            'chances': {i:j/len(res_dict["final_stage"]) for i,j in dict(sorted(Counter(res_dict["final_stage"]).items())).items()},
+            'aggregates': {'highest': max(res_dict['final_stage']), 'median': floor(statistics.median(res_dict['final_stage'])), 'average': sum(res_dict['final_stage']) // len(res_dict['final_stage']), 'lowest': min(res_dict['final_stage'])},
+            'chances': {stage: stage_counts[stage] / len(res_dict['final_stage']) for stage in sorted(stage_counts)},
             }
         res_avg['is_comparison'] = False
         return res_avg, res_std
@@ -243,6 +301,28 @@ class SimulationManager():
                 else:
                     yield from get_all_values(v)
 
+        def column_width(d: Dict) -> int:
+            """Nested helper function to find the widest formatted value of a nested dictionary. For finite values the formatted
+            length only grows with magnitude, so only the largest and the smallest (most negative) of them are formatted. The inf
+            and nan entries that comparisons produce are formatted individually.
+
+            Args:
+                d (Dict): Dictionary to measure.
+
+            Returns:
+                int: Width of the widest value.
+            """
+            finite = []
+            widths = []
+            for v in get_all_values(d):
+                if isfinite(v):
+                    finite.append(v)
+                else:
+                    widths.append(len(f'{v:,.2f}'))
+            if finite:
+                widths += [len(f'{max(finite):,.2f}'), len(f'{min(finite):,.2f}')]
+            return max(widths)
+
         console = rich.get_console()
         # base table
         stats_table = rich.table.Table(title="Combat Statistics", expand=True, show_header=True, header_style="bold dim cyan", caption='*) Loot values are arbitrary and for build comparison only.\n\u2020) Smaller values are better here.')
@@ -265,8 +345,8 @@ class SimulationManager():
             stats_table.add_column("+/- Std Dev", justify='right', style="dim yellow")
         keys_to_display = ['main', 'offence', 'sustain', 'defence', 'effects', 'loot'] if show_stats else ['loot']
         # for combat stat table column widths, adjusted via output formatting
-        max_width_avg = max([max(len(f'{k:,.2f}') for k in get_all_values(dict1))])
-        max_width_std = max([max(len(f'{k:,.2f}') for k in get_all_values(dict2))])
+        max_width_avg = column_width(dict1)
+        max_width_std = column_width(dict2)
         for k in keys_to_display:
             last_key = ''
             for subkey in dict1[k]:
@@ -331,12 +411,9 @@ class SimulationManager():
             for _ in range(items_per_row):
                 stage_breakdown_table.add_column("", style="cyan")
                 stage_breakdown_table.add_column("", style="dim")
-            # dict1['final_stage']['chances'] = dict(sorted(dict1['final_stage']['chances'].items(), key=lambda item: item[0]))
-            stages = list(map(lambda x: f'{x:>4}', dict1['final_stage']['chances'].keys()))
-            chances = list(map(lambda x: f'{x:>7,.2%}', dict1['final_stage']['chances'].values()))
-            for i in range(0, len(dict1['final_stage']['chances'].keys()), items_per_row):
-                row = [e for e in chain(*zip(stages[i:i+items_per_row], chances[i:i+items_per_row]))]
-                stage_breakdown_table.add_row(*row)
+            cells = [cell for stage, chance in dict1['final_stage']['chances'].items() for cell in (f'{stage:>4}', f'{chance:>7,.2%}')]
+            for i in range(0, len(cells), 2 * items_per_row):
+                stage_breakdown_table.add_row(*cells[i:i + 2 * items_per_row])
             sbt_panel = rich.panel.Panel(stage_breakdown_table, title="Stage Result Breakdown", border_style="bold dim cyan")
         table_group = rich.console.Group(
             *[stats_table, stage_table, sbt_panel] if not is_comparison else [stats_table, stage_table],
@@ -346,13 +423,17 @@ class SimulationManager():
 
 
 class Simulation():
+    __slots__ = ('hunter', 'enemies', 'current_stage', 'queue', 'elapsed_time', 'debug')
+
     def __init__(self, hunter: Hunter) -> None:
         self.hunter: Hunter = hunter
         self.hunter.sim = self
-        self.enemies: List[Enemy] = None
+        self.enemies: Deque[Enemy] = None
         self.current_stage = -1
         self.queue: List[tuple] = []
         self.elapsed_time: int = 0
+        # resolved once per simulation so units can skip building log messages that would be discarded
+        self.debug: bool = logging.getLogger().isEnabledFor(logging.DEBUG)
 
     def complete_stage(self) -> None:
         """Increment stage counter for simulation and hunter.
@@ -367,14 +448,17 @@ class Simulation():
             hunter (Hunter): Hunter instance.
         """
         if self.current_stage % 100 == 0 and self.current_stage > 0:
-            self.enemies = [Boss(f'B{self.current_stage:>3}{1:>3}', hunter, self.current_stage, self)]
+            self.enemies = deque([Boss(f'B{self.current_stage:>3}{1:>3}', hunter, self.current_stage, self)])
         else:
-            self.enemies = [Enemy(f'E{self.current_stage:>3}{i+1:>3}', hunter, self.current_stage, self) for i in range(10)]
+            self.enemies = deque(Enemy(f'E{self.current_stage:>3}{i+1:>3}', hunter, self.current_stage, self) for i in range(10))
 
     def refresh_enemies(self) -> None:
-        """Remove dead enemies from the list.
+        """Remove dead enemies from the front of the queue. Trample kills the next alive enemies in order, so the dead ones always
+        form a prefix of the queue.
         """
-        self.enemies = [e for e in self.enemies if not e.is_dead()]
+        enemies = self.enemies
+        while enemies and enemies[0].is_dead():
+            enemies.popleft()
 
     def run(self) -> Dict:
         """Run a single simulation.
@@ -383,7 +467,9 @@ class Simulation():
             defaultdict: Results of the simulation.
         """
         self.simulate_combat(self.hunter)
-        return self.hunter.get_results() | {'elapsed_time': self.elapsed_time}
+        res = self.hunter.get_results()
+        res['elapsed_time'] = self.elapsed_time
+        return res
 
     def simulate_combat(self, hunter: Hunter) -> None:
         """Simulate combat behaviour for a hunter.
@@ -397,46 +483,55 @@ class Simulation():
         """
         self.current_stage = 0
         self.elapsed_time = 0
-        self.queue = []
-        hpush(self.queue, (round(hunter.speed, 3), 1, 'hunter'))
-        hpush(self.queue, (self.elapsed_time, 3, 'regen'))
+        self.queue = queue = []
+        hpush(queue, (round(hunter.speed, 3), 1, EV_HUNTER))
+        hpush(queue, (self.elapsed_time, 3, EV_REGEN))
+        # the hunter and the debug flag stay the same for the whole run, so their lookups are bound once for the event loop
+        debug = self.debug
+        hunter_attack, hunter_regen = hunter.attack, hunter.regen_hp
         while not hunter.is_dead():
-            logging.debug('')
-            logging.debug(f'Entering STAGE {self.current_stage}')
+            if debug:
+                logging.debug('')
+                logging.debug(f'Entering STAGE {self.current_stage}')
             self.spawn_enemies(hunter)
             while self.enemies:
-                logging.debug('')
-                logging.debug(hunter)
-                enemy = self.enemies.pop(0)
-                logging.debug(enemy)
+                enemy = self.enemies.popleft()
+                if debug:
+                    logging.debug('')
+                    logging.debug(hunter)
+                    logging.debug(enemy)
                 enemy.queue_initial_attack()
-                # combat loop
-                while not enemy.is_dead() and not hunter.is_dead():
-                    logging.debug(f'[  QUEUE]:           {self.queue}')
-                    prev_time, _, action = hpop(self.queue)
-                    match action:
-                        case 'hunter':
-                            hunter.attack(enemy)
-                            hpush(self.queue, (round(prev_time + hunter.speed, 3), 1, 'hunter'))
-                        case 'enemy':
-                            enemy.attack(hunter)
-                            if not enemy.is_dead():
-                                hpush(self.queue, (round(prev_time + enemy.speed, 3), 2, 'enemy'))
-                        case 'stun':
-                            hunter.apply_stun(enemy, isinstance(enemy, Boss))
-                        case 'hunter_special':
-                            hunter.attack(enemy)
-                        case 'enemy_special':
-                            enemy.attack_special(hunter)
-                            if not enemy.is_dead():
-                                hpush(self.queue, (round(prev_time + enemy.speed2, 3), 2, 'enemy_special'))
-                        case 'regen':
-                            hunter.regen_hp()
-                            enemy.regen_hp()
-                            self.elapsed_time += 1
-                            hpush(self.queue, (self.elapsed_time, 3, 'regen'))
-                        case _:
-                            raise ValueError(f'Unknown action: {action}')
+                # combat loop, checks hp directly instead of calling is_dead() on both units for every event
+                while enemy.hp > 0 and hunter.hp > 0:
+                    if debug:
+                        logging.debug(f'[  QUEUE]:           {[(t, p, event_names[a]) for t, p, a in queue]}')
+                    prev_time, _, action = queue[0]
+                    # branches are ordered by how often each event occurs: regen ticks by far the most, then hunter and enemy attacks
+                    if action == EV_REGEN:
+                        # regen always reschedules 1s later, so it can be swapped in place before its effects run
+                        hreplace(queue, (self.elapsed_time + 1, 3, EV_REGEN))
+                        hunter_regen()
+                        enemy.regen_hp()
+                        self.elapsed_time += 1
+                        continue
+                    hpop(queue)
+                    if action == EV_HUNTER:
+                        hunter_attack(enemy)
+                        hpush(queue, (round(prev_time + hunter.speed, 3), 1, EV_HUNTER))
+                    elif action == EV_ENEMY:
+                        enemy.attack(hunter)
+                        if enemy.hp > 0:
+                            hpush(queue, (round(prev_time + enemy.speed, 3), 2, EV_ENEMY))
+                    elif action == EV_STUN:
+                        hunter.apply_stun(enemy, enemy.is_boss)
+                    elif action == EV_HUNTER_SPECIAL:
+                        hunter_attack(enemy)
+                    elif action == EV_ENEMY_SPECIAL:
+                        enemy.attack_special(hunter)
+                        if enemy.hp > 0:
+                            hpush(queue, (round(prev_time + enemy.speed2, 3), 2, EV_ENEMY_SPECIAL))
+                    else:
+                        raise ValueError(f'Unknown action: {action}')
                 if hunter.is_dead():
                     return
             self.complete_stage()
@@ -1,15 +1,24 @@
 import logging
-import random
 from heapq import heapify
 from heapq import heappush as hpush
+from random import random
+from typing import Dict, Tuple
 
-from hunters import Borge, Hunter, Ozzy
+from hunters import EV_ENEMY, EV_ENEMY_SPECIAL, Borge, Hunter, Ozzy
 
 unit_name_spacing: int = 7
 
 # TODO: Verify whether Gothmogor's secondary attack contributes to enrage stacks
 
 class Enemy:
+    is_boss: bool = False
+    # stats only depend on the enemy class, the hunter class and the stage, so each combination is only fetched once
+    _stats_cache: Dict[Tuple[type, type, int], dict] = {}
+    __slots__ = (
+        'name', '_name_pad', 'sim', 'hp', 'max_hp', 'power', 'regen', 'damage_reduction', 'evade_chance', 'special_chance',
+        'special_damage', 'speed', 'speed2', 'has_special', 'secondary_attack', 'enrage_effect', 'enrage_effect2', 'stun_duration',
+    )
+
     ### CREATION
     def __init__(self, name: str, hunter: Hunter, stage: int, sim) -> None:
         """Creates an Enemy instance.
@@ -20,7 +29,10 @@ class Enemy:
             stage (int): The stage of the enemy, for stat selection.
             sim (Simulation): The simulation that this enemy is a part of.
         """
-        self.__create__(name=name, **self.fetch_stats(hunter, stage))
+        key = (type(self), type(hunter), stage)
+        if (stats := self._stats_cache.get(key)) is None:
+            stats = self._stats_cache[key] = self.fetch_stats(hunter, stage)
+        self.__create__(name=name, **stats)
         self.sim = sim
         self.on_create(hunter)
 
@@ -111,6 +123,7 @@ class Enemy:
                 speed2 (float): Speed of the secondary attack of the enemy.
         """
         self.name: str = name
+        self._name_pad: str = f'{name:>{unit_name_spacing}}'
         self.hp: float = float(hp)
         self.max_hp: float = float(hp)
         self.power: float = power
@@ -122,9 +135,9 @@ class Enemy:
         self.special_damage: float = min(special_damage, 2.5)
         self.speed: float = speed
         self.has_special = False
-        if isinstance(self, Boss): # regular boss enrage effect
+        if self.is_boss: # regular boss enrage effect
             self.enrage_effect = kwargs['enrage_effect']
-        if isinstance(self, Boss) and 'special' in kwargs: # boss enrage effect for secondary moves
+        if self.is_boss and 'special' in kwargs: # boss enrage effect for secondary moves
             self.secondary_attack: str = kwargs['special']
             self.speed2: float = kwargs['speed2']
             self.enrage_effect2 = kwargs['enrage_effect2']
@@ -138,22 +151,22 @@ class Enemy:
         Args:
             hunter (Hunter): The hunter that this enemy is fighting.
         """
-        if 'presence_of_god' in hunter.talents:
+        if hasattr(hunter.talents, 'presence_of_god'):
             hunter.apply_pog(self)
-        if 'omen_of_defeat' in hunter.talents:
+        if hasattr(hunter.talents, 'omen_of_defeat'):
             hunter.apply_ood(self)
-        if 'soul_of_snek' in hunter.attributes:
+        if hasattr(hunter.attributes, 'soul_of_snek'):
             hunter.apply_snek(self)
-        if 'gift_of_medusa' in hunter.attributes:
+        if hasattr(hunter.attributes, 'gift_of_medusa'):
             hunter.apply_medusa(self)
 
     ### CONTENT
     def queue_initial_attack(self) -> None:
         """Queue the initial attacks of the enemy.
         """
-        hpush(self.sim.queue, (round(self.sim.elapsed_time + self.speed, 3), 2, 'enemy'))
+        hpush(self.sim.queue, (round(self.sim.elapsed_time + self.speed, 3), 2, EV_ENEMY))
         if self.has_special:
-            hpush(self.sim.queue, (round(self.sim.elapsed_time + self.speed2, 3), 2, 'enemy_special'))
+            hpush(self.sim.queue, (round(self.sim.elapsed_time + self.speed2, 3), 2, EV_ENEMY_SPECIAL))
 
     def attack(self, hunter: Hunter) -> None:
         """Attack the hunter.
@@ -161,14 +174,16 @@ class Enemy:
         Args:
             hunter (Hunter): The hunter to attack.
         """
-        if random.random() < self.special_chance:
+        if random() < self.special_chance:
             damage = self.power * self.special_damage
             is_crit = True
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} (crit)")
+            if self.sim.debug:
+                logging.debug(f"[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} (crit)")
         else:
             damage = self.power
             is_crit = False
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f}")
+            if self.sim.debug:
+                logging.debug(f"[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f}")
         hunter.receive_damage(self, damage, is_crit)
 
     def receive_damage(self, damage: float, is_reflected: bool = False) -> None:
@@ -177,12 +192,14 @@ class Enemy:
         Args:
             damage (float): Damage to receive.
         """
-        if not is_reflected and random.random() < self.evade_chance:
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tEVADE")
+        if not is_reflected and random() < self.evade_chance:
+            if self.sim.debug:
+                logging.debug(f"[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tEVADE")
         else:
             mitigated_damage = damage * (1 - self.damage_reduction)
             self.hp -= mitigated_damage
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tTAKE\t{mitigated_damage:>6.2f}, {self.hp:.2f} HP left")
+            if self.sim.debug:
+                logging.debug(f"[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tTAKE\t{mitigated_damage:>6.2f}, {self.hp:.2f} HP left")
             if self.is_dead():
                 if is_reflected:
                     self.sim.hunter.helltouch_kills += 1
@@ -197,11 +214,15 @@ class Enemy:
         """
         effective_heal = min(value, self.missing_hp)
         self.hp += effective_heal
-        logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\t{source.upper().replace('_', ' ')}\t{effective_heal:>6.2f}")
+        if self.sim.debug:
+            logging.debug(f"[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\t{source.upper().replace('_', ' ')}\t{effective_heal:>6.2f}")
 
     def regen_hp(self) -> None:
         """Regenerates hp according to the regen stat.
         """
+        # nothing to heal at full hp, unless Ozzy's Gift of Medusa turned regen negative
+        if self.hp >= self.max_hp and self.regen >= 0:
+            return
         regen_value = self.regen
         self.heal_hp(regen_value, 'regen')
         # handle death from Ozzy's Gift of Medusa
@@ -215,18 +236,13 @@ class Enemy:
         Args:
             duration (float): The duration of the stun.
         """
-        qe = [(p1, p2, u) for p1, p2, u in self.sim.queue if u == 'enemy'][0]
-        self.sim.queue.remove(qe)
-        hpush(self.sim.queue, (qe[0] + duration, qe[1], qe[2]))
-        logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tSTUNNED\t{duration:>6.2f} sec")
-
-    def is_boss(self) -> bool:
-        """Check if the unit is a boss.
-
-        Returns:
-            bool: True if the unit is a boss, False otherwise.
-        """
-        return isinstance(self, Boss)
+        queue = self.sim.queue
+        # stop at the first (and only) queued regular attack instead of collecting all matches
+        i = next(i for i, (_, _, u) in enumerate(queue) if u == EV_ENEMY)
+        t, prio, u = queue.pop(i)
+        hpush(queue, (t + duration, prio, u))
+        if self.sim.debug:
+            logging.debug(f"[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tSTUNNED\t{duration:>6.2f} sec")
 
     def is_dead(self) -> bool:
         """Check if the unit is dead.
@@ -239,10 +255,12 @@ class Enemy:
     def on_death(self, suppress_logging: bool = False) -> None:
         """Executes on death effects. For enemy units, that is mostly just removing them from the sim queue and incrementing hunter kills.
         """
-        if not suppress_logging:
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tDIED")
-        self.sim.queue = [(p1, p2, u) for p1, p2, u in self.sim.queue if u not in ['enemy', 'enemy_special']]
-        heapify(self.sim.queue)
+        if self.sim.debug and not suppress_logging:
+            logging.debug(f"[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tDIED")
+        queue = self.sim.queue
+        # filtered in place: simulate_combat holds a local reference to the queue
+        queue[:] = [(p1, p2, u) for p1, p2, u in queue if u != EV_ENEMY and u != EV_ENEMY_SPECIAL]
+        heapify(queue)
         self.sim.hunter.total_kills += 1
         self.sim.hunter.on_kill()
 
@@ -271,10 +289,13 @@ class Enemy:
         Returns:
             str: The stats as a formatted string.
         """
-        return f'[{self.name:>{unit_name_spacing}}]:\t[HP:{(str(round(self.hp, 2)) + "/" + str(round(self.max_hp, 2))):>18}] [AP:{self.power:>8.2f}] [Regen:{self.regen:>7.2f}] [DR: {self.damage_reduction:>6.2%}] [Evasion: {self.evade_chance:>6.2%}] [Effect: ------] [CHC: {self.special_chance:>6.2%}] [CHD: {self.special_damage:>5.2f}] [Speed:{self.speed:>5.2f}]{(f" [Speed2:{self.speed2:>6.2f}]") if self.has_special else ""}'
+        return f'[{self._name_pad}]:\t[HP:{(str(round(self.hp, 2)) + "/" + str(round(self.max_hp, 2))):>18}] [AP:{self.power:>8.2f}] [Regen:{self.regen:>7.2f}] [DR: {self.damage_reduction:>6.2%}] [Evasion: {self.evade_chance:>6.2%}] [Effect: ------] [CHC: {self.special_chance:>6.2%}] [CHD: {self.special_damage:>5.2f}] [Speed:{self.speed:>5.2f}]{(f" [Speed2:{self.speed2:>6.2f}]") if self.has_special else ""}'
 
 
 class Boss(Enemy):
+    is_boss: bool = True
+    __slots__ = ('_speed', '_speed2', 'enrage_stacks', 'max_enrage', 'harden_ticks_left', 'previous_dr')
+
     ### CREATION
     def __init__(self, name: str, hunter: Hunter, stage: int, sim) -> None:
         """Creates a Boss instance.
@@ -285,7 +306,7 @@ class Boss(Enemy):
             stage (int): The stage of the boss, for stat selection.
             sim (Simulation): The simulation that this enemy is a part of.
         """
-        super(Boss, self).__init__(name, hunter, stage, sim)
+        super().__init__(name, hunter, stage, sim)
         self.enrage_stacks: int = 0
         self.harden_ticks_left: int = 0 # Exoscarab secondary attack mechanic
         self.max_enrage: bool = False
@@ -374,14 +395,16 @@ class Boss(Enemy):
         Args:
             hunter (Hunter): The hunter to attack.
         """
-        super(Boss, self).attack(hunter)
+        super().attack(hunter)
         self.enrage_stacks += 1
-        logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tENRAGE\t{self.enrage_stacks:>6.2f} stacks")
+        if self.sim.debug:
+            logging.debug(f"[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tENRAGE\t{self.enrage_stacks:>6.2f} stacks")
         if self.enrage_stacks >= 200 and not self.max_enrage:
             self.max_enrage = True
             self.power *= 3
             self.special_chance = 1
-            logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tMAX ENRAGE (x3 damage, 100% crit chance)")
+            if self.sim.debug:
+                logging.debug(f"[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tMAX ENRAGE (x3 damage, 100% crit chance)")
 
     def attack_special(self, hunter: Hunter) -> None:
         """Attack the hunter with a special attack.
@@ -390,14 +413,16 @@ class Boss(Enemy):
             hunter (Hunter): The hunter to attack.
         """
         if self.secondary_attack == 'gothmorgor':
-            if random.random() < self.special_chance:
+            if random() < self.special_chance:
                 damage = self.power * self.special_damage
                 is_crit = True
-                logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} SECONDARY (crit)")
+                if self.sim.debug:
+                    logging.debug(f"[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} SECONDARY (crit)")
             else:
                 damage = self.power
                 is_crit = False
-                logging.debug(f"[{self.name:>{unit_name_spacing}}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} SECONDARY")
+                if self.sim.debug:
+                    logging.debug(f"[{self._name_pad}][@{self.sim.elapsed_time:>5}]:\tATTACK\t{damage:>6.2f} SECONDARY")
             hunter.receive_damage(self, damage, is_crit)
             self.enrage_stacks += 1
         elif self.secondary_attack == 'exoscarab':
@@ -439,7 +464,7 @@ class Boss(Enemy):
     def on_death(self) -> None:
         """Extends the Enemy::on_death() method to log enrage stacks on death.
         """
-        super(Boss, self).on_death()
+        super().on_death()
         self.sim.hunter.enrage_log.append(self.enrage_stacks)
 
     @property